@@ -6,10 +6,11 @@ custom ratelimit headers (X-Ratelimit-*)
 
 import logging
 import random
+import threading
 import time
-from json import JSONDecodeError
 from typing import Any
 
+import orjson
 import requests
 
 from mdex_tool.errors import ApiError
@@ -17,6 +18,13 @@ from mdex_tool.models import Config
 
 logger = logging.getLogger(__name__)
 
+# Monotonic time until which no GET requests should be sent. This is shared
+# so concurrent callers wait out the same ratelimit once, not one each
+_ratelimit_until = 0.0  # pylint: disable=invalid-name
+_ratelimit_lock = threading.Lock()
+# Monotonic time of the next free slot handed out by `wait_for_request_slot()`
+_next_request_slot = 0.0  # pylint: disable=invalid-name
+
 
 def safe_get_json(
     url: str,
@@ -49,28 +57,60 @@ def safe_get_json(
     r = get_with_ratelimit(url, session, cfg, params)
 
     try:
-        r_json = r.json()
-    except JSONDecodeError:
+        r_json = orjson.loads(r.content)
+    except orjson.JSONDecodeError:
         logger.warning("Failed to decode response into JSON")
-        logger.debug("Raw response received: %s", r.text)
+        if logger.isEnabledFor(logging.DEBUG):  # r.text decodes the whole body
+            logger.debug("Raw response received: %s", r.text)
         raise ApiError("Request failed (JSONDecodeError)", r) from None
 
-    assert_ok_response(r_json)
-
     if not isinstance(r_json, dict):
         logger.warning(
             "Expected type dict for JSON response, instead got %s", type(r_json)
         )
         raise ApiError("Malformed response (incorrect type)", r)
 
+    # MangaDex responses always have a result key with value "ok" on success
+    if r_json.get("result") != "ok":
+        logger.error("Non-ok response from API. Full JSON response: %s", r_json)
+        raise ApiError("API returned non-ok response", r)
+
     return r_json
 
 
-def assert_ok_response(r_json: dict[str, Any]) -> None:
-    """Checks that the JSON response (MangaDex) has a result key with value "ok" """
-    if r_json.get("result") != "ok":
-        logger.error("Non-ok response from API. Full JSON response: %s", r_json)
-        raise ApiError("API returned non-ok response")
+def _extend_ratelimit(seconds: float) -> None:
+    """Pushes the shared ratelimit deadline to atleast `seconds` from now."""
+    global _ratelimit_until  # pylint: disable=global-statement
+
+    with _ratelimit_lock:
+        _ratelimit_until = max(_ratelimit_until, time.monotonic() + seconds)
+
+
+def _wait_for_ratelimit() -> None:
+    """Sleeps until the shared ratelimit deadline has passed, if it hasn't."""
+    wait = _ratelimit_until - time.monotonic()
+    if wait > 0:
+        logger.info("Waiting %.2f seconds for ratelimit", wait)
+        time.sleep(wait)
+
+
+def wait_for_request_slot(interval: float) -> None:
+    """
+    Sleeps until this caller's turn to send a request, with turns spaced
+    at least `interval` seconds apart (and after any ratelimit).
+
+    Concurrent callers use this to stay under a requests-per-second limit,
+    which a cap on how many requests are in flight doesn't guarantee.
+    """
+    global _next_request_slot  # pylint: disable=global-statement
+
+    with _ratelimit_lock:
+        now = time.monotonic()
+        slot = max(now, _ratelimit_until, _next_request_slot)
+        _next_request_slot = slot + interval
+
+    if slot > now:
+        time.sleep(slot - now)
 
 
 def get_with_ratelimit(
@@ -89,21 +129,16 @@ def get_with_ratelimit(
     This essentially acts as a wrapper for `sessions.get(url, ...)`
     """
 
-    if params is not None:
-        r = session.get(url, timeout=cfg.reqs.get_timeout, params=params)
-    else:
-        r = session.get(url, timeout=cfg.reqs.get_timeout)
+    _wait_for_ratelimit()
+    r = session.get(url, timeout=cfg.reqs.get_timeout, params=params)
 
     if r.status_code != 429:
         return r
     logger.warning("Ratelimited (received status code 429)")
 
-    try:
-        retry_after = r.headers["X-RateLimit-Retry-After"]
-    except KeyError:
-        raise ApiError(
-            "Ratelimit but not provided 'X-RateLimit-Retry-After' header", r
-        ) from None
+    retry_after = r.headers.get("X-RateLimit-Retry-After")
+    if retry_after is None:
+        raise ApiError("Ratelimit but not provided 'X-RateLimit-Retry-After' header", r)
 
     logger.info("X-RateLimit-Retry-After = %s", retry_after)
     try:
@@ -115,8 +150,10 @@ def get_with_ratelimit(
 
     # imitating Retry() behaviour
     logger.info("Time to sleep: %s seconds", tts)
-    print(f"Ratelimited! Please wait {tts} seconds...")
-    time.sleep(tts)
-    time.sleep(random.uniform(0, cfg.retry.backoff_jitter))
+    if threading.current_thread() is threading.main_thread():
+        # Background fetches (e.g. prefetches) shouldn't print over the menu
+        print(f"Ratelimited! Please wait {tts} seconds...")
+    _extend_ratelimit(tts + random.uniform(0, cfg.retry.backoff_jitter))
+    _wait_for_ratelimit()
 
-    return session.get(url, timeout=cfg.reqs.get_timeout)
+    return session.get(url, timeout=cfg.reqs.get_timeout, params=params)
@@ -6,47 +6,113 @@ each chapter, and not for the entire manga
 """
 
 import logging
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from sys import platform as PLATFORM
-from typing import Any
+from typing import Any, BinaryIO
 
 # pylint:disable=c-extension-no-member
 import pycurl
+import requests
 
 from mdex_tool import PROJECT_ROOT
 from mdex_tool.api.client import safe_get_json
-from mdex_tool.api.http_config import get_retry_session
+from mdex_tool.api.http_config import get_shared_session
 from mdex_tool.cli.ansi.output import ProgressBar
 from mdex_tool.errors import ApiError
-from mdex_tool.models import Chapter, ChapterGetResponse, Config, ImageReport, Manga
+from mdex_tool.models import (
+    Chapter,
+    ChapterGetResponse,
+    Config,
+    ImageReport,
+    Manga,
+)
 
 logger = logging.getLogger(__name__)
 
+# Larger than most pages, so each image is usually written in one write()
+_FILE_BUFFER_SIZE = 1 << 20  # 1 MiB
+# Max bytes libcurl passes per write callback (its default is 16 KiB)
+_CURL_BUFFER_SIZE = 1 << 18  # 256 KiB
+
+# Responses that mean the image server wants fewer concurrent requests
+_OVERLOAD_CODES = frozenset((429, 503))
+
+# Whether the linked libcurl supports HTTP/2 (index 4 is its feature bitmask)
+_HAS_HTTP2 = bool(pycurl.version_info()[4] & pycurl.VERSION_HTTP2)
+
+# Characters not allowed in Windows filenames, mapped to "_"
+_WIN32_INVALID_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+
+
+@dataclass(slots=True)
+class _PageState:
+    """The page an in-flight curl handle is downloading"""
+
+    idx: int
+    url: str
+    cached: list[bool]  # set by the handle's header callback
+    fp: BinaryIO
+
+
+def _new_page_handle() -> pycurl.Curl:
+    """Creates a curl handle with the options shared by every page download"""
+    c = pycurl.Curl()
+    c.setopt(pycurl.BUFFERSIZE, _CURL_BUFFER_SIZE)
+    if _HAS_HTTP2:  # setting HTTP/2 errors if libcurl was built without it
+        # Multiplex pages over one HTTP/2 connection to the CDN when possible
+        c.setopt(pycurl.HTTP_VERSION, pycurl.CURL_HTTP_VERSION_2TLS)
+        c.setopt(pycurl.PIPEWAIT, 1)
+
+    return c
+
+
+def _no_progress(_: float):
+    """Default `progress_out` for downloads, which discards the progress"""
+
+
+def _check_cache_header(cached: list[bool], line: bytes):
+    """pycurl `HEADERFUNCTION` that sets `cached[0]` on an `X-Cache: HIT` header"""
+    if line[:12].lower() == b"x-cache: hit":
+        cached[0] = True
+
 
 class Downloader:
     """
     Wraps fetching, downloading and saving functionality for
     a specified `Chapter` object, following config rules.
+
+    Unless a `session` is passed, the shared session from
+    `get_shared_session()` is used so connections to the API
+    are reused between chapters.
     """
 
-    def __init__(self, manga: Manga, chapter: Chapter, cfg: Config):
+    __slots__ = ("session", "cfg", "chapter", "manga_title", "chapter_dir")
+
+    def __init__(
+        self,
+        manga: Manga,
+        chapter: Chapter,
+        cfg: Config,
+        session: requests.Session | None = None,
+    ):
         logger.debug("Created Downloader() instance with chapter id: %s", chapter.uuid)
 
-        self.session = get_retry_session(cfg.retry)
+        self.session = session or get_shared_session(cfg.retry)
         self.cfg = cfg
         self.chapter = chapter
         self.manga_title = manga.title[: self.cfg.save.max_title_length]
 
         if PLATFORM == "win32":
-            invalid = '<>:"/\\|?*'
-            title_mutable = list(self.manga_title)
+            self.manga_title = self.manga_title.translate(_WIN32_INVALID_CHARS)
 
-            for i, ch in enumerate(title_mutable):
-                if ch in invalid:
-                    title_mutable[i] = "_"
-
-            self.manga_title = "".join(title_mutable)
+        # Where the chapter's images are saved; created upon download
+        self.chapter_dir = (
+            PROJECT_ROOT / self.cfg.save.location / self.manga_title / chapter.title
+        )
 
     def __repr__(self):
         # Full Manga object isn't included because only the title is saved
@@ -72,8 +138,9 @@ class Downloader:
         try:
             base_url = r_json["baseUrl"]
             chapter_hash = r_json["chapter"]["hash"]
-            filenames_data = tuple(r_json["chapter"]["data"])
-            filenames_data_saver = tuple(r_json["chapter"]["dataSaver"])
+            # Not copied into tuples, as they are only ever read from
+            filenames_data = r_json["chapter"]["data"]
+            filenames_data_saver = r_json["chapter"]["dataSaver"]
 
         except KeyError as e:
             logger.warning("Missing key '%s' in _unpack_cdn_data()", e)
@@ -102,7 +169,7 @@ class Downloader:
 
         return self._unpack_cdn_data(r_json)
 
-    def _construct_image_urls(self, cdn_data: ChapterGetResponse) -> tuple[str, ...]:
+    def _construct_image_urls(self, cdn_data: ChapterGetResponse) -> list[str]:
         if self.cfg.images.use_datasaver:
             quality = "data-saver"
             filenames = cdn_data.filenames_data_saver
@@ -112,7 +179,7 @@ class Downloader:
 
         cdn_url = f"{cdn_data.base_url}/{quality}/{cdn_data.chapter_hash}/"
 
-        return tuple(cdn_url + f for f in filenames)
+        return [cdn_url + f for f in filenames]
 
     def _get_image_fp(self, idx: int, zeros: int, ext: str) -> Path:
         """
@@ -126,23 +193,12 @@ class Downloader:
         Returns:
             Path: where the image should be saved given its info
         """
-        idx_zp = str(idx).zfill(zeros)
-
-        image_fp = Path(
-            PROJECT_ROOT
-            / self.cfg.save.location
-            / self.manga_title
-            / self.chapter.title
-            / f"{idx_zp}{ext}"
-        )
-        image_fp.parent.mkdir(parents=True, exist_ok=True)
-
-        return image_fp
+        return self.chapter_dir / f"{idx:0{zeros}d}{ext}"
 
     def _get_image_stats(
         self,
         url: str,
-        headers: list[str],
+        cached: bool,
         c: pycurl.Curl,
     ) -> ImageReport:
         response_code = c.getinfo(pycurl.RESPONSE_CODE)
@@ -150,7 +206,7 @@ class Downloader:
         stats = {
             "url": url,
             "success": 200 <= response_code < 300,
-            "cached": any(h.lower().startswith("x-cache: hit") for h in headers),
+            "cached": cached,
             "size_bytes": int(c.getinfo(pycurl.SIZE_DOWNLOAD)),
             "duration_ms": int(c.getinfo(pycurl.TOTAL_TIME) * 1000),
         }
@@ -158,37 +214,103 @@ class Downloader:
         logger.debug("ImageReport for chapter '%s': %s", self.chapter.uuid, stats)
         return ImageReport(**stats)
 
-    def _download_image(self, url, fp: Path) -> ImageReport:
-        """Downloads the image at the provided URL and saves it at the given filepath."""
-        c = pycurl.Curl()
-        headers = []
+    def _download_pages(  # pylint: disable=too-many-locals
+        self,
+        multi: pycurl.CurlMulti,
+        handles: list[pycurl.Curl],
+        pages: list[tuple[int, str]],
+        zeros: int,
+    ) -> Iterator[tuple[int, ImageReport]]:
+        """
+        Downloads the given `(idx, url)` pages concurrently through `multi`,
+        yielding `(idx, ImageReport)` as each finishes.
 
-        def header_func(line):
-            headers.append(line.decode("iso-8859-1").strip())
+        At most `len(handles)` transfers are in flight at once. The handles
+        are reused for the remaining pages and left open for the caller.
 
-        with fp.open("wb") as f:
-            c.setopt(pycurl.URL, url)
-            c.setopt(pycurl.WRITEDATA, f)
-            c.setopt(pycurl.HEADERFUNCTION, header_func)
+        Like TCP congestion control, the in-flight limit is halved whenever
+        the server responds with 429 or 503 and grows back by one page per
+        window of successful pages (AIMD).
+        """
+        pending = deque(pages)
+        free = list(handles)
+        active: dict[pycurl.Curl, _PageState] = {}  # in-flight handles
+        in_flight = 0
+        window = float(len(handles))  # current in-flight limit
 
-            try:
-                c.perform()
-                stats = self._get_image_stats(url, headers, c)
+        try:
+            while pending or in_flight:
+                while pending and free and in_flight < window:
+                    idx, url = pending.popleft()
+                    c = free.pop()
+                    active[c] = self._start_page(c, url, idx, zeros)
+                    multi.add_handle(c)
+                    in_flight += 1
+
+                while multi.perform()[0] == pycurl.E_CALL_MULTI_PERFORM:
+                    pass
+
+                while True:
+                    queued, ok_list, err_list = multi.info_read()
+                    finished: list[tuple[pycurl.Curl, str | None]] = [
+                        (c, None) for c in ok_list
+                    ]
+                    finished.extend((c, err) for c, _, err in err_list)
+
+                    for c, err in finished:
+                        free.append(c)
+                        in_flight -= 1
+                        page = active.pop(c)
+                        report = self._finish_page(multi, c, page, err)
+
+                        if c.getinfo(pycurl.RESPONSE_CODE) in _OVERLOAD_CODES:
+                            window = max(1.0, window / 2)
+                            logger.info("Server overloaded, window: %.2f", window)
+                        elif report.success:
+                            window = min(len(handles), window + 1 / window)
+
+                        yield page.idx, report
+
+                    if not queued:
+                        break
+
+                if in_flight:
+                    multi.select(1.0)
+        finally:
+            for c, page in active.items():  # interrupted
+                multi.remove_handle(c)
+                page.fp.close()
+
+    def _start_page(self, c: pycurl.Curl, url: str, idx: int, zeros: int) -> _PageState:
+        """Points the handle `c` at the page `url` and opens its file."""
+        ext = url[url.rfind(".") :]  # MangaDex filenames always have one
+        fp = self._get_image_fp(idx, zeros, ext)
+        page = _PageState(idx, url, [False], fp.open("wb", buffering=_FILE_BUFFER_SIZE))
+
+        c.setopt(pycurl.URL, url)
+        c.setopt(pycurl.WRITEDATA, page.fp)
+        c.setopt(pycurl.HEADERFUNCTION, partial(_check_cache_header, page.cached))
+        return page
+
+    def _finish_page(
+        self,
+        multi: pycurl.CurlMulti,
+        c: pycurl.Curl,
+        page: _PageState,
+        err: str | None,
+    ) -> ImageReport:
+        """Detaches the finished handle `c` and reports how its `page` went."""
+        multi.remove_handle(c)
+        page.fp.close()
 
-            except pycurl.error as e:
-                logger.warning("Encountered PyCurl error: %s", e)
-                stats = ImageReport(url, False, False, 0, 0)  # error sentinels
-            finally:
-                c.close()
+        if err is not None:
+            logger.warning("Encountered PyCurl error: %s", err)
+            return ImageReport(page.url, False, False, 0, 0)  # error sentinels
 
-        return stats
+        return self._get_image_stats(page.url, page.cached[0], c)
 
-    def _download_images(
-        self,
-        progress_out: Callable[[float], None],
-        retries: int | None,
-        last_base_url: str | None,
-        img_start_idx=0,
+    def _download_images(  # pylint: disable=too-many-locals
+        self, progress_out: Callable[[float], None]
     ):
         """
         Downloads all images from the specified chapter.
@@ -196,59 +318,88 @@ class Downloader:
         All images are saved under the configured save location
         under the manga title and chapter number.
 
+        Pages that fail are retried (up to `cfg.retry.max_retries` passes)
+        with a fresh base URL, without re-downloading the ones that succeeded.
+
         Args:
-            progress_out (function, optional): where image progress
+            progress_out (function): where image progress
                 (float, e.g. 7/20) is sent.
+        """
+        self.chapter_dir.mkdir(parents=True, exist_ok=True)  # once, not per page
 
-                Defaults to the no-op `lambda *_: None`
+        pending: set[int] | None = None  # one-indexed pages left to download
+        last_base_url: str | None = None
+        done = 0
+        track_progress = progress_out is not _no_progress
 
-            retries (int | None): the retries left
-            last_base_url (str | None): the last base url from the previous recursion
-            img_start_idx (int, optional): where the last recursion ended off before
-                presumably failing. Defaults to 0.
-        """
-        # how many times to try getting a new base url
-        if retries is None:
-            retries = self.cfg.retry.max_retries
-        if retries == 0:
-            raise ApiError("Failed all retries to download the chapter")
-
-        logger.info("Downloading images. Retries left: %s", retries)
-
-        cdn_data = self._send_chapter_get()
-        base_url = cdn_data.base_url
-        if base_url == last_base_url:
-            logger.warning("Received same base URL upon failure")
-            return
-        if not all(
-            (
-                cdn_data.chapter_hash,
-                cdn_data.filenames_data,
-                cdn_data.filenames_data_saver,
-            )
-        ):
-            logger.info("No downloadable chapters available. (Received empty CDN data)")
-
-        urls = self._construct_image_urls(cdn_data)
-        zeros = len(str(len(urls)))
-
-        for idx, url in enumerate(urls[img_start_idx:], start=1):
-            ext = Path(url).suffix
-            fp = self._get_image_fp(idx, zeros, ext)
-            report = self._download_image(url, fp)
-            if report.success:
-                progress_out((idx) / len(urls))
-                continue
-
-            progress_out(ProgressBar.FAIL)
-            logger.warning("Failed to download image (success = %s)", report.success)
-            self._download_images(progress_out, retries - 1, base_url, idx)
-            # self._send_image_report(*report)
-            # ^ Check ahead for why this is commented out!
+        # Kept for the whole chapter so retries reuse connections to the CDN
+        multi = pycurl.CurlMulti()
+        multi.setopt(pycurl.M_PIPELINING, pycurl.PIPE_MULTIPLEX)
+        handles: list[pycurl.Curl] = []
+
+        try:
+            # how many times to try getting a new base url
+            for retries in range(self.cfg.retry.max_retries, 0, -1):
+                logger.info("Downloading images. Retries left: %s", retries)
+
+                cdn_data = self._send_chapter_get()
+                if cdn_data.base_url == last_base_url:
+                    logger.warning("Received same base URL upon failure")
+                    return
+                last_base_url = cdn_data.base_url
+
+                if not all(
+                    (
+                        cdn_data.chapter_hash,
+                        cdn_data.filenames_data,
+                        cdn_data.filenames_data_saver,
+                    )
+                ):
+                    logger.info(
+                        "No downloadable chapters available. (Received empty CDN data)"
+                    )
+
+                urls = self._construct_image_urls(cdn_data)
+                zeros = len(str(len(urls)))
+                if pending is None:
+                    if self.chapter.pages not in (None, len(urls)):
+                        logger.warning(
+                            "Chapter has %s pages in its feed but %s from the CDN",
+                            self.chapter.pages,
+                            len(urls),
+                        )
+                    pending = set(range(1, len(urls) + 1))
+                    n_handles = min(self.cfg.images.max_concurrency, len(urls))
+                    handles.extend(_new_page_handle() for _ in range(n_handles))
+
+                pages = [(idx, urls[idx - 1]) for idx in sorted(pending)]
+                for idx, report in self._download_pages(multi, handles, pages, zeros):
+                    if report.success:
+                        pending.discard(idx)
+                        done += 1
+                        if track_progress:  # division keeps the last page exactly 1.0
+                            progress_out(done / len(urls))
+                        continue
+
+                    logger.warning(
+                        "Failed to download image (success = %s)", report.success
+                    )
+                    # self._send_image_report(*report)
+                    # ^ Check ahead for why this is commented out!
+
+                if not pending:
+                    return
+                progress_out(ProgressBar.FAIL)
+        finally:
+            for c in handles:
+                c.close()
+            multi.close()
+
+        raise ApiError("Failed all retries to download the chapter")
 
     def download_images(
         self,
-        progress_out: Callable[[float], None] = lambda *_: None,
+        progress_out: Callable[[float], None] = _no_progress,
     ):
         """
         Downloads all images from the stored chapter.
@@ -260,10 +411,10 @@ class Downloader:
             progress_out (function, optional): where image progress
                 (float, e.g. 7/20) is sent.
 
-                Defaults to the no-op `lambda *_: None`
+                Defaults to the no-op `_no_progress`
         """
         progress_out(0.0)
-        self._download_images(progress_out, retries=None, last_base_url=None)
+        self._download_images(progress_out)
 
     ## Right now, MangaDex's reporting system seems to be down, according to
     ## my and others' experiences, so this function will remain unused for now.
@@ -2,14 +2,23 @@
 Contains the retry config used for requests sessions.
 """
 
+import threading
+
 import requests
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from urllib3.util.retry import Retry
 
 from mdex_tool.load_config import RetryConfig
 
+_shared_session: requests.Session | None = None  # pylint: disable=invalid-name
+_shared_session_lock = threading.Lock()
+
+# Connections kept per host; the shared session is used by several threads
+# at once (feed pages, search prefetching) on top of the main thread
+_SHARED_POOL_SIZE = 16
 
-def _get_retry_adapter(retry_cfg: RetryConfig):
+
+def _get_retry_adapter(retry_cfg: RetryConfig, pool_maxsize: int = DEFAULT_POOLSIZE):
     """Creates a Retry() config with the given config cfg"""
     retry_config = Retry(
         total=retry_cfg.max_retries,
@@ -20,14 +29,32 @@ def _get_retry_adapter(retry_cfg: RetryConfig):
         allowed_methods={"GET"},
         respect_retry_after_header=False,  # MangaDex sends non-conventional "X-*" headers
     )
-    return HTTPAdapter(max_retries=retry_config)
+    return HTTPAdapter(max_retries=retry_config, pool_maxsize=pool_maxsize)
 
 
-def get_retry_session(retry_cfg: RetryConfig) -> requests.Session:
+def get_retry_session(
+    retry_cfg: RetryConfig, pool_maxsize: int = DEFAULT_POOLSIZE
+) -> requests.Session:
     """Returns a session mounted with the retry adapter from `get_retry_adapter()`"""
     session = requests.session()
-    adapter = _get_retry_adapter(retry_cfg)
+    adapter = _get_retry_adapter(retry_cfg, pool_maxsize)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
 
     return session
+
+
+def get_shared_session(retry_cfg: RetryConfig) -> requests.Session:
+    """
+    Returns the process-wide retry session, creating it on first use.
+
+    Callers that don't need their own session should use this, so
+    connections (and their TLS handshakes) are reused between them.
+    """
+    global _shared_session  # pylint: disable=global-statement
+
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = get_retry_session(retry_cfg, _SHARED_POOL_SIZE)
+
+        return _shared_session
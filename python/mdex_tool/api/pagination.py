@@ -4,16 +4,27 @@ search caching of queries.
 """
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from itertools import batched
 from typing import Any
 
-from mdex_tool.api.client import safe_get_json
-from mdex_tool.api.http_config import get_retry_session
+import requests
+
+from mdex_tool.api.client import safe_get_json, wait_for_request_slot
+from mdex_tool.api.http_config import get_shared_session
 from mdex_tool.api.search import Searcher
 from mdex_tool.models import Chapter, Config, Manga, MangaResults
 
 logger = logging.getLogger(__name__)
 
+_FEED_LIMIT = 500  # the max that MangaDex allows
+_MAX_FEED_OFFSET = 9500  # MangaDex rejects (offset + limit) > 10'000
+_FEED_WORKERS = 4  # feed pages fetched at once
+# Feed requests are spaced this far apart (in seconds) to stay under
+# MangaDex's global ratelimit of ~5 req/s, however many workers there are
+_FEED_REQUEST_INTERVAL = 0.2
+
 
 class MangaPaginator:
     """
@@ -23,6 +34,8 @@ class MangaPaginator:
     self._query.
     """
 
+    __slots__ = ("_page", "_query", "searcher", "total_pages", "pages", "_prefetcher")
+
     def __init__(
         self,
         query: str,
@@ -36,8 +49,10 @@ class MangaPaginator:
 
         page_limit = cfg.search.results_per_page
         self.total_pages = (first_page.total + page_limit - 1) // page_limit
-        self.pages: list[MangaResults | None] = [first_page]
-        self.pages.extend([None] * (self.total_pages - 1))
+        # Only pages that were visited (or prefetched) are stored. Pages
+        # being prefetched are stored as futures until they're loaded
+        self.pages: dict[int, MangaResults | Future[MangaResults]] = {0: first_page}
+        self._prefetcher = ThreadPoolExecutor(max_workers=1)
 
     # pylint:disable=missing-function-docstring
     @property
@@ -58,24 +73,45 @@ class MangaPaginator:
         """
         Returns the MangaResults of the current page.
 
-        This checks if the page is already cached before fetching it from
-        MangaDex.
-
-        Raises:
-            IndexError: if the page index is out of range
+        This checks if the page is already cached (or being prefetched)
+        before fetching it from MangaDex. The next page is then prefetched
+        in the background, since users usually page forward.
 
         Returns:
             MangaResults: the results of the given page
         """
-        if not 0 <= self.page < len(self.pages):
-            raise IndexError(f"Page index {self.page} out of range")
-        if self.pages[self.page] is not None:
-            return self.pages[self.page]  # type: ignore
-
-        res = self.searcher.search(self.query, self.page)
-        self.pages[self.page] = res
+        page = self._page  # always in range, as the setter wraps it around
+        cached = self.pages.get(page)
+        if isinstance(cached, MangaResults):
+            res = cached
+        elif isinstance(cached, Future) and cached.exception() is None:
+            res = cached.result()
+        else:  # not fetched yet, or the prefetch failed
+            res = self.searcher.search(self._query, page)
+
+        self.pages[page] = res
+        self._prefetch(page + 1)
         return res
 
+    def close(self):
+        """
+        Stops prefetching, cancelling any prefetch that hasn't started.
+
+        This doesn't wait for a running prefetch. The paginator shouldn't
+        be used after this.
+        """
+        self._prefetcher.shutdown(wait=False, cancel_futures=True)
+
+    def _prefetch(self, page: int):
+        """Starts fetching `page` in the background if it isn't cached yet."""
+        if page >= self.total_pages or page in self.pages:
+            return
+
+        logger.debug("Prefetching page %s for query '%s'", page, self.query)
+        self.pages[page] = self._prefetcher.submit(
+            self.searcher.search, self.query, page
+        )
+
 
 class ChapterPaginator:
     """
@@ -85,8 +121,12 @@ class ChapterPaginator:
     are fetched upon creation and then paginated internally for UX.
     """
 
-    def __init__(self, manga: Manga, cfg: Config):
-        self.session = get_retry_session(cfg.retry)
+    __slots__ = ("session", "manga", "cfg", "pages", "total_pages", "_page")
+
+    def __init__(
+        self, manga: Manga, cfg: Config, session: requests.Session | None = None
+    ):
+        self.session = session or get_shared_session(cfg.retry)
         self.manga = manga
         self.cfg = cfg
 
@@ -128,18 +168,16 @@ class ChapterPaginator:
         for cd in chapter_data:
             uuid = cd["id"]
             chap_num = cd["attributes"]["chapter"]
-            chapter = Chapter(uuid, chap_num)
+            chapter = Chapter(uuid, chap_num, cd["attributes"].get("pages"))
 
-            if is_float_coercible(chap_num) and "." in chap_num:
+            # only parsed once; the partition below tells floats from int-likes
+            if is_float_coercible(chap_num):
                 left, sep, right = chap_num.partition(".")
-                # ljust to zeropad decimal part; e.g. 0.1 -> 0.10
-                padded = left.zfill(zeros) + sep + right.ljust(2, "0")
-                chapter.title = f"Ch. {padded}"
-                chapters.append(chapter)
-                continue
+                if sep:  # ljust to zeropad decimal part; e.g. 0.1 -> 0.10
+                    chapter.title = f"Ch. {left.zfill(zeros)}.{right.ljust(2, '0')}"
+                else:  # int-like
+                    chapter.title = f"Ch. {chap_num.zfill(zeros)}"
 
-            if is_float_coercible(chap_num):  # int-like
-                chapter.title = f"Ch. {str(chap_num).zfill(zeros)}"
                 chapters.append(chapter)
                 continue
 
@@ -168,7 +206,6 @@ class ChapterPaginator:
             (tuple[Chapter, ...]): all chapters of the manga
         """
         feed = f"{self.cfg.reqs.api_root}/manga/{self.manga.uuid}/feed"
-        chapter_data: list[dict[str, Any]] = []
 
         # 18+ filtering should be done upstream in the Searcher class
         params: dict[str, Any] = {
@@ -176,35 +213,47 @@ class ChapterPaginator:
             "contentRating[]": ["safe", "suggestive", "erotica", "pornographic"],
             "order[chapter]": "asc",
             "includeEmptyPages": 0,
-            "limit": 500,  # the max that MangaDex allows
-            "offset": 0,
+            "includeExternalUrl": 0,  # hosted elsewhere, so not downloadable
+            "limit": _FEED_LIMIT,
         }
 
-        # Keep fetching until no results
-        while True:
-            if params["offset"] >= 9500:
-                logger.warning("Max pagination reached (offset + limit) > 10'000")
-                break
+        # The first page says how many chapters there are, so the
+        # remaining pages can then be fetched concurrently
+        first = self._get_feed_page(feed, params, 0)
+        chapter_data: list[dict[str, Any]] = first["data"]
+        total = first["total"]
+        if total > _MAX_FEED_OFFSET:
+            logger.warning("Max pagination reached (offset + limit) > 10'000")
 
-            logger.info(
-                "Fetching chapters for '%s', page=%s",
-                self.manga.title,
-                params["offset"] // 500,
-            )
+        offsets = range(_FEED_LIMIT, min(total, _MAX_FEED_OFFSET), _FEED_LIMIT)
+        with ThreadPoolExecutor(max_workers=_FEED_WORKERS) as pool:
+            fetch = partial(self._get_feed_page, feed, params)
+            for r_json in pool.map(fetch, offsets):  # results stay in order
+                chapter_data += r_json["data"]
 
-            r_json = safe_get_json(feed, self.session, self.cfg, params)
-            logger.debug(  # this produces overhead; keep the dict comp here
-                "Pagination info: %s", {k: v for k, v in r_json.items() if k != "data"}
-            )
-
-            if not r_json["data"]:
-                logger.info("Received blank data; fetching stopped")
-                break
+        return self._format_chapter_titles(chapter_data)
 
-            chapter_data += r_json["data"]
-            params["offset"] += 500
+    def _get_feed_page(
+        self, feed: str, params: dict[str, Any], offset: int
+    ) -> dict[str, Any]:
+        """Fetches one page of the manga feed, starting at `offset`."""
+        logger.info(
+            "Fetching chapters for '%s', page=%s",
+            self.manga.title,
+            offset // _FEED_LIMIT,
+        )
+
+        wait_for_request_slot(_FEED_REQUEST_INTERVAL)
+        r_json = safe_get_json(
+            feed, self.session, self.cfg, {**params, "offset": offset}
+        )
+        if logger.isEnabledFor(logging.DEBUG):  # skip building the dict otherwise
+            logger.debug(
+                "Pagination info: %s",
+                {k: v for k, v in r_json.items() if k != "data"},
+            )
 
-        return self._format_chapter_titles(chapter_data)
+        return r_json
 
     def load_page(self) -> tuple[Chapter, ...]:
         """Returns the chapters at the current page."""
@@ -1,26 +1,60 @@
 """Contains the Searcher() class."""
 
 import logging
+from collections.abc import Mapping
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from urllib.parse import urlencode
 from typing import Any
 
+import requests
+
 from mdex_tool.api.client import safe_get_json
-from mdex_tool.api.http_config import get_retry_session
+from mdex_tool.api.http_config import get_shared_session
 from mdex_tool.models import Config, Manga, MangaResults
 
 logger = logging.getLogger(__name__)
 
+_SEARCH_CACHE_SIZE = 256  # pages of search results kept in memory
+
+# Search params that don't depend on the query.
+# Ref: https://api.mangadex.org/docs/redoc.html#tag/Manga/operation/get-search-manga
+_SEARCH_PARAMS: Mapping[str, Any] = MappingProxyType(
+    {
+        "order[relevance]": "desc",
+        "hasAvailableChapters": "true",  # not perfect; chapters w/ 0 pages exist
+        "availableTranslatedLanguage[]": ("en",),
+    }
+)
+_NSFW_SEARCH_PARAMS: Mapping[str, Any] = MappingProxyType(
+    {
+        **_SEARCH_PARAMS,
+        "contentRating[]": ("safe", "suggestive", "erotica", "pornographic"),
+    }
+)
+_ATTRS_AND_ID = itemgetter("attributes", "id")  # of each manga in a response
+_TITLE_LANGS = ("en", "ja-ro", "ja")  # in order of preference
+# Shared, read-only fallback for a missing title or tag name
+_NO_NAMES: Mapping[str, str] = MappingProxyType({})
+
 
 class Searcher:
     """
     Contains searching functionality.
 
-    NOTE: There should only be one instance of this class
-    created throughout the program's runtime.
+    NOTE: The search cache holds onto each instance, so reuse one
+    Searcher rather than creating one per search (see `cli.menus`).
     """
 
-    def __init__(self, cfg: Config):
-        self.session = get_retry_session(cfg.retry)
+    def __init__(self, cfg: Config, session: requests.Session | None = None):
+        self.session = session or get_shared_session(cfg.retry)
         self.cfg = cfg
+        base_params = (
+            _NSFW_SEARCH_PARAMS if cfg.search.include_pornographic else _SEARCH_PARAMS
+        )
+        # Encoded once, so only the per-search params are encoded on each search
+        self._base_query = urlencode(base_params, doseq=True)
 
     def _safe_get_json(self, url: str, params: dict[str, Any] | None = None):
         """Packages safe_get_json() from .api.client into a method."""
@@ -36,9 +70,29 @@ class Searcher:
         Returns:
             str: the title
         """
-        titles = mattributes.get("title", {})
+        titles = mattributes.get("title") or _NO_NAMES  # also covers a null title
+
+        for lang in _TITLE_LANGS:
+            if title := titles.get(lang):
+                return title
+
+        return "Untitled"
+
+    def _get_tags(self, mattributes: dict) -> tuple[str, ...]:
+        """
+        Gets the English names of a manga's tags.
 
-        return titles.get("en") or titles.get("ja-ro") or titles.get("ja") or "Untitled"
+        Args:
+            mattributes (dict): the ["attributes"] key of a manga from `GET /manga` or search result
+
+        Returns:
+            tuple[str, ...]: the tag names, skipping tags without an English name
+        """
+        return tuple(
+            name
+            for tag in mattributes.get("tags") or ()
+            if (name := (tag["attributes"].get("name") or _NO_NAMES).get("en"))
+        )
 
     def search(self, query: str, page: int = 0) -> MangaResults:
         """
@@ -49,6 +103,9 @@ class Searcher:
 
         Pornographic results will only be included if configured as such.
 
+        Results are cached by query and page, so revisiting a query (or page)
+        doesn't send another request. See `Searcher._search.cache_clear()`.
+
         Args:
             query (str): the search query, which should match a manga's title
             page (int, optional): which page to query.
@@ -60,20 +117,18 @@ class Searcher:
             MangaResults: the results for the selected page as
                 `tuple[Manga, ...]` and the total number of results
         """
-        params = {
-            "title": query,
-            "order[relevance]": "desc",
-            "hasAvailableChapters": "true",  # not perfect; chapters w/ 0 pages exist
-            "availableTranslatedLanguage[]": ["en"],
-            "limit": self.cfg.search.results_per_page,
-            "offset": self.cfg.search.results_per_page * page,
-        }  # Ref: https://api.mangadex.org/docs/redoc.html#tag/Manga/operation/get-search-manga
-
-        if self.cfg.search.include_pornographic:
-            params = {
-                **params,
-                "contentRating[]": ["safe", "suggestive", "erotica", "pornographic"],
+        return self._search(query, page)  # positional, so cache keys match
+
+    @lru_cache(maxsize=_SEARCH_CACHE_SIZE)
+    def _search(self, query: str, page: int) -> MangaResults:
+        """The uncached `search()`, wrapped in an LRU cache."""
+        params = urlencode(
+            {
+                "title": query,
+                "limit": self.cfg.search.results_per_page,
+                "offset": self.cfg.search.results_per_page * page,
             }
+        )
         logger.info(
             "Searching for query '%s' on page %s. Pornographic results included: %s",
             query,
@@ -81,20 +136,24 @@ class Searcher:
             self.cfg.search.include_pornographic,
         )
 
-        endpoint = f"{self.cfg.reqs.api_root}/manga"
-        r_json = self._safe_get_json(endpoint, params)
-        results: list[Manga] = []
-
-        for m in r_json["data"]:
-            results.append(Manga(self._get_title(m["attributes"]), m["id"]))
-
-        return MangaResults(tuple(results), total=r_json["total"])
+        endpoint = f"{self.cfg.reqs.api_root}/manga?{self._base_query}&{params}"
+        r_json = self._safe_get_json(endpoint)
+        get_title, get_tags = self._get_title, self._get_tags
+
+        return MangaResults(
+            tuple(
+                Manga(get_title(attrs), uuid, get_tags(attrs))
+                for attrs, uuid in map(_ATTRS_AND_ID, r_json["data"])
+            ),
+            total=r_json["total"],
+        )
 
     def get_random_manga(self) -> Manga | None:
         """Fetches a random manga from the `GET /manga/random` endpoint."""
         endpoint = f"{self.cfg.reqs.api_root}/manga/random"
         r_json = self._safe_get_json(endpoint)
+        attrs = r_json["data"]["attributes"]
 
         return Manga(
-            self._get_title(r_json["data"]["attributes"]), r_json["data"]["id"]
+            self._get_title(attrs), r_json["data"]["id"], self._get_tags(attrs)
         )
@@ -2,16 +2,32 @@
 Where the AnsiOutput class is stored.
 """
 
+import sys
+from functools import lru_cache
+
 from mdex_tool.cli.ansi.fg_colors import CYAN, DEFAULT, GREEN, RED, YELLOW
 from mdex_tool.cli.ansi.text_styles import BOLD, DIM, INVERSE, ITALIC, RESET, UNDERLINE
 from mdex_tool.models import CliConfig
 
 
+@lru_cache(maxsize=32)
+def _ansi_prefix(text_styles: tuple[str, ...], fg_color: str) -> str:
+    """Builds the SGR escape sequence that starts the given styles and colour."""
+    return f"\033[{';'.join(text_styles)};{fg_color}m"
+
+
+def _format_plain(message: str, *_, **__) -> str:
+    """Stand-in for `AnsiOutput.format_ansi()` when ANSI is disabled."""
+    return message
+
+
 class AnsiOutput:
     """Groups methods that use ANSI."""
 
     def __init__(self, cli_cfg: CliConfig):
         self.use_ansi = cli_cfg.use_ansi
+        if not self.use_ansi:  # never changes, so don't check it on every call
+            self.format_ansi = _format_plain  # type: ignore
 
     def format_ansi(
         self,
@@ -22,13 +38,10 @@ class AnsiOutput:
         """
         Formats the message with the given ANSI enums.
 
-        If ANSI is not enabled, return original message.
+        If ANSI is not enabled, return original message. (This is done by
+        replacing this method with `_format_plain()` in `__init__`.)
         """
-        if not self.use_ansi:
-            return message
-
-        codes = f"{';'.join(text_styles)};{fg_color}"
-        return f"\033[{codes}m{message}\033[0m"
+        return f"{_ansi_prefix(text_styles, fg_color)}{message}\033[0m"
 
     def print_ansi(
         self,
@@ -84,20 +97,24 @@ class ProgressBar(AnsiOutput):
     _CARRIAGE_RETURN_PAD = " " * 4
     _HIDE_CURSOR = "\033[?25l"
     _SHOW_CURSOR = "\033[?25h"
-    _REDBAR = "\033[31m━\033[0m"
-    _GREENBAR = "\033[32m━\033[0m"
+    _BAR = "━"
+    _GREEN = "\033[32m"
+    _RED = "\033[31m"
+    _RESET = "\033[0m"
 
     def __init__(self, cli_cfg: CliConfig, label: str = "Loading...", bars: int = 20):
         self.label = label
         self.bars = bars
         super().__init__(cli_cfg)
+        self._styled_label = self.format_ansi(label, fg_color=CYAN)
+        self._last_drawn = (-1, "")  # (complete bars, percentage) last displayed
 
-    def _display_no_ansi(self, percentage: str):
+    def _display_no_ansi(self, progress: float, percentage: str):
         """Prints a progress bar without ANSI."""
         output = f"{self.label} {percentage}"
         print(output + self._CARRIAGE_RETURN_PAD, end="\r")
 
-        if percentage == "100%":
+        if progress >= 1.0:
             print()
 
     def _display_err_no_ansi(self):
@@ -124,12 +141,17 @@ class ProgressBar(AnsiOutput):
             self._display_err()
             return
 
-        perc = f"{round(progress * 100)}%"
-        if not self.use_ansi:
-            self._display_no_ansi(perc)
+        perc = f"{progress * 100:.0f}%"
+        complete_bars = int(self.bars * progress)
+        # Skip ticks that wouldn't change what's on screen; always draw the
+        # final tick so the line is ended
+        if (complete_bars, perc) == self._last_drawn and progress < 1.0:
             return
+        self._last_drawn = (complete_bars, perc)
 
-        print(ProgressBar._HIDE_CURSOR, end="")
+        if not self.use_ansi:
+            self._display_no_ansi(progress, perc)
+            return
 
         # Assuming `ProgressBar.FAIL` is negative (should be -1.0)
         if progress > 1.0:
@@ -139,19 +161,21 @@ class ProgressBar(AnsiOutput):
                 f"Progress cannot be less than 0% (0.0) if it's not {ProgressBar.FAIL}"
             )
 
-        complete_bars = int(self.bars * progress)
-        progress_bar = ProgressBar._GREENBAR * complete_bars
-        progress_bar += ProgressBar._REDBAR * (self.bars - complete_bars)
-
-        self.print_ansi(self.label, fg_color=CYAN, end=" ")
-        print(f"{progress_bar}", end=" ")
-        self.print_ansi(perc + self._CARRIAGE_RETURN_PAD, fg_color=RED, end="\r")
-
-        if progress == 1.0:
-            print()
-
-        print(ProgressBar._SHOW_CURSOR, end="")
-        return
+        # One colour change per segment instead of an escape sequence per bar
+        progress_bar = (
+            f"{ProgressBar._GREEN}{ProgressBar._BAR * complete_bars}"
+            f"{ProgressBar._RED}{ProgressBar._BAR * (self.bars - complete_bars)}"
+            f"{ProgressBar._RESET}"
+        )
+        perc = self.format_ansi(perc + self._CARRIAGE_RETURN_PAD, fg_color=RED)
+        newline = "\n" if progress == 1.0 else ""
+
+        # Written in one go, so each tick is a single write and flush
+        sys.stdout.write(
+            f"{ProgressBar._HIDE_CURSOR}{self._styled_label} {progress_bar} "
+            f"{perc}\r{newline}{ProgressBar._SHOW_CURSOR}"
+        )
+        sys.stdout.flush()
 
     def _display_err(self):
         """Prints a progress bar's error form"""
@@ -160,12 +184,14 @@ class ProgressBar(AnsiOutput):
             self._display_err_no_ansi()
             return
 
-        self.print_ansi(self.label, fg_color=CYAN, end=" ")
+        print(self._styled_label, end=" ")
         self.print_ansi("FAILED", text_styles=(INVERSE,), fg_color=RED, end=" ")
         # Shorten bars to keep line-width consistent if possible
         bars = self.bars - 7  # 7 = len(" FAILED")
         if self.bars - 7 <= 0:
             bars = 0
 
-        print(ProgressBar._REDBAR * bars, end=" ")
+        print(
+            f"{ProgressBar._RED}{ProgressBar._BAR * bars}{ProgressBar._RESET}", end=" "
+        )
         self.print_ansi("ERR%", fg_color=RED)
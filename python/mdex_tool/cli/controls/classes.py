@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Control:
     """
     Contains a control and its description used for UI navigation.
@@ -25,7 +25,7 @@ class Control:
         return self.label
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlGroup:
     """
     Contains a tuple of Control dataclasses.
@@ -10,19 +10,31 @@ From: https://github.com/joeyespo/py-getch/blob/master/getch/getch.py
 try:
     from msvcrt import getch
 except ImportError:
+    import copy
+    import sys
+    import termios
+    import tty
+
+    # (original, raw) terminal modes; they don't change, so they're
+    # fetched once instead of on every keypress
+    _modes = None  # pylint: disable=invalid-name
 
     def getch():
         """
         Gets a single character from STDIO.
         """
-        import sys
-        import termios
-        import tty
+        global _modes  # pylint: disable=global-statement
 
         fd = sys.stdin.fileno()
-        old = termios.tcgetattr(fd)
+        if _modes is None:
+            old = termios.tcgetattr(fd)
+            raw = copy.deepcopy(old)
+            tty.cfmakeraw(raw)
+            _modes = (old, raw)
+
+        old, raw = _modes
+        termios.tcsetattr(fd, termios.TCSAFLUSH, raw)  # same as tty.setraw()
         try:
-            tty.setraw(fd)
             return sys.stdin.read(1)
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old)
@@ -1,16 +1,17 @@
 """Stores classes used to handle menus"""
 
 import logging
+import shutil
 import sys
 import textwrap
 import time
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import lru_cache
+from itertools import batched
+from typing import TYPE_CHECKING
 
-from mdex_tool.api.download import Downloader
-from mdex_tool.api.pagination import ChapterPaginator, MangaPaginator
-from mdex_tool.api.search import Searcher
-from mdex_tool.cli.ansi.output import AnsiOutput, ProgressBar
+from mdex_tool.cli.ansi.output import ProgressBar
 from mdex_tool.cli.controls.classes import Control, ControlGroup
 from mdex_tool.cli.controls.constants import (
     BACK,
@@ -29,8 +30,82 @@ from mdex_tool.cli.controls.constants import (
 from mdex_tool.cli.utils import CliUtils
 from mdex_tool.models import Config, Manga, MangaResults
 
+# The API modules (and requests, pycurl) are slow to import, so they're
+# imported by the menus that use them instead of delaying the main menu
+# pylint: disable=import-outside-toplevel
+if TYPE_CHECKING:
+    from mdex_tool.api.search import Searcher
+
 logger = logging.getLogger(__name__)
 
+# The prompt line, then the blank line and error message after invalid input,
+# as long as neither of them wraps
+_INVALID_INPUT_LINES = 3
+
+
+_shared_utils: CliUtils | None = None  # pylint: disable=invalid-name
+
+
+def _get_shared_utils(cfg: Config) -> CliUtils:
+    """
+    Returns the CliUtils shared by all menus, creating it on first use.
+
+    A menu is created on every push, so this saves building a new CliUtils
+    (and AnsiOutput) each time.
+    """
+    global _shared_utils  # pylint: disable=global-statement
+
+    if _shared_utils is None or _shared_utils.cfg is not cfg:
+        _shared_utils = CliUtils(cfg)
+    return _shared_utils
+
+
+_shared_searcher: "Searcher | None" = None  # pylint: disable=invalid-name
+
+
+def _get_shared_searcher(cfg: Config) -> "Searcher":
+    """
+    Returns the Searcher shared by every SearchMenu, creating it on first use.
+
+    Its search cache holds onto the Searcher, so a new one per SearchMenu
+    would keep each discarded Searcher (and its cached pages) alive.
+    """
+    global _shared_searcher  # pylint: disable=global-statement
+    from mdex_tool.api.search import Searcher
+
+    if _shared_searcher is None or _shared_searcher.cfg is not cfg:
+        _shared_searcher = Searcher(cfg)
+    return _shared_searcher
+
+
+@lru_cache(maxsize=16)
+def _with_indices(keys: frozenset[str], count: int) -> frozenset[str]:
+    """
+    Returns `keys` along with the one-indexed numbers up to `count` as strings.
+
+    Cached, since pages (almost) always have the same number of results.
+    """
+    return keys.union(map(str, range(1, count + 1)))
+
+
+@lru_cache(maxsize=16)
+def _layout_controls(labels: tuple[str, ...], options_per_row: int) -> str:
+    """
+    Lays out control labels into rows with equal spacing.
+
+    Cached, since each menu's controls are laid out the same on every redraw.
+    """
+    # if it's just one row
+    if len(labels) <= options_per_row:
+        return "  ".join(labels) + "\n"
+
+    width = max(len(l) for l in labels) + 1
+    rows = (
+        "".join(f"{l:<{width}}" for l in row[:-1]) + row[-1]
+        for row in batched(labels, options_per_row)
+    )
+    return "\n".join(rows) + "\n"
+
 
 class Menu:
     """
@@ -47,35 +122,18 @@ class Menu:
     description = "_OVERRIDE_ME_"
 
     def __init__(self, cfg: Config):
-        self.keys = {c.key for c in self.CG.controls}
+        self.keys = frozenset(c.key for c in self.CG.controls)
         self.cfg = cfg
-        self.utils = CliUtils(cfg)
-        self.ansi = AnsiOutput(cfg.cli)
+        self.utils = _get_shared_utils(cfg)
+        self.ansi = self.utils.ansi
 
     def _show_controls(self):
         """
         Prints all the controls within `self.CG` with equal
         spacing and according to `config.cli.options_per_row`
         """
-        # if it's just one row
-        if len(self.CG.controls) <= self.cfg.cli.options_per_row:
-            print("  ".join([c.label for c in self.CG.controls]))
-            return
-
-        options_per_row = self.cfg.cli.options_per_row
         labels = tuple(c.label for c in self.CG.controls)
-        max_len = max(len(l) for l in labels)
-
-        for idx, l in enumerate(labels):
-            spacing = (max_len + 1) - len(l)
-
-            if (idx + 1) % options_per_row == 0:  # New row
-                print(l)
-            else:  # Stay on current
-                print(l, end=" " * spacing)
-
-        if len(labels) % options_per_row != 0:
-            print()  # Newline at end of options if not already printed
+        sys.stdout.write(_layout_controls(labels, self.cfg.cli.options_per_row))
 
     def show(self):
         """
@@ -88,11 +146,32 @@ class Menu:
             print(self.description + "\n")
         self._show_controls()
 
+    def _reprompt(self, user_input: str, error_msg: str):
+        """
+        Gets the terminal ready to take input again after invalid input.
+
+        With ANSI, only the prompt and error message are erased, since
+        the rest of the menu hasn't changed. Otherwise, or if either of them
+        may have wrapped onto more than one line, the menu is redrawn.
+        """
+        columns = shutil.get_terminal_size().columns
+        # Non-ASCII characters may be wider than one column, so don't assume
+        fits = all(
+            line.isascii() and len(line) < columns
+            for line in (f">> {user_input}", error_msg)
+        )
+
+        if self.cfg.cli.use_ansi and fits:
+            self.utils.erase_lines(_INVALID_INPUT_LINES)
+        else:
+            self.utils.clear()
+            self.show()
+
     def get_option(self) -> str:
         """Gets a validated option from the user."""
+        self.utils.clear()
+        self.show()
         while True:
-            self.utils.clear()
-            self.show()
             if self.USE_GETCH:
                 user_input = self.utils.get_input_key()
             else:
@@ -106,10 +185,19 @@ class Menu:
                 return user_input
 
             if self.USE_GETCH:
-                print(self.ansi.to_err(f"\nInvalid menu key: {user_input!r}"))
+                error_msg = f"Invalid menu key: {user_input!r}"
             else:
-                print(self.ansi.to_err(f"\nInvalid input: {user_input!r}"))
+                error_msg = f"Invalid input: {user_input!r}"
+            print(self.ansi.to_err("\n" + error_msg))
             time.sleep(self.cfg.cli.time_to_read)
+            self._reprompt(user_input, error_msg)
+
+    def close(self):
+        """
+        Releases anything the menu holds once it's popped off the stack.
+
+        Subclasses that start background work should override this.
+        """
 
     def handle_option_defaults(self, option: str) -> "MenuAction":
         """
@@ -157,11 +245,18 @@ class MenuStack:
         self.menus = menus
 
     def pop(self) -> Menu | None:
-        """Removed the Menu at the top of the stack."""
+        """Removed the Menu at the top of the stack, closing it."""
         if self.menus:
-            return self.menus.pop()
+            menu = self.menus.pop()
+            menu.close()
+            return menu
         return None
 
+    def close_all(self) -> None:
+        """Closes every Menu in the stack, from the top down (e.g. on exit)."""
+        for menu in reversed(self.menus):
+            menu.close()
+
     def push(self, menu: Menu) -> None:
         """Adds a Menu to the top of the stack."""
         self.menus.append(menu)
@@ -174,11 +269,12 @@ class MenuStack:
 
     def handle_action(self, menu_action: MenuAction):
         """Handles MenuAction instances returned by Menu subclasses."""
-        logger.debug(
-            "Received MenuAction: %s, %s",
-            type(menu_action.menu).__name__,
-            menu_action.action.name,
-        )
+        if logger.isEnabledFor(logging.DEBUG):  # skip building the args otherwise
+            logger.debug(
+                "Received MenuAction: %s, %s",
+                type(menu_action.menu).__name__,
+                menu_action.action.name,
+            )
         match menu_action.action:
             case Action.PUSH:
                 self.push(menu_action.menu)  # type: ignore
@@ -231,7 +327,7 @@ class SearchMenu(Menu):
     description = "Search for a manga's title or enter ':B' to go back"
 
     def __init__(self, cfg):
-        self.searcher = Searcher(cfg)
+        self.searcher = _get_shared_searcher(cfg)
         super().__init__(cfg)
 
     def show(self):
@@ -273,11 +369,13 @@ class ResultsMenu(Menu):
 
     def __init__(
         self,
-        searcher: Searcher,
+        searcher: "Searcher",
         query: str,
         first_page: MangaResults,
         cfg: Config,
     ):
+        from mdex_tool.api.pagination import MangaPaginator
+
         if cfg.search.results_per_page >= 10:
             self.USE_GETCH = False  # pylint:disable=invalid-name
 
@@ -295,7 +393,7 @@ class ResultsMenu(Menu):
 
     def get_option(self) -> str:
         max_manga_index = len(self.ss.load_page().results)
-        allowed = self.keys.union({str(i) for i in range(1, max_manga_index + 1)})
+        allowed = _with_indices(self.keys, max_manga_index)
 
         while True:
             if self.USE_GETCH:
@@ -306,10 +404,13 @@ class ResultsMenu(Menu):
             if option not in allowed:
                 print(self.ansi.to_err("\nInvalid input"))
                 time.sleep(self.cfg.cli.time_to_read)
-                self.show()
+                self._reprompt(option, "Invalid input")
             else:
                 return option
 
+    def close(self):
+        self.ss.close()
+
     def handle_option(self, option: str) -> MenuAction:
         if option == NEXT_PAGE.key:
             self.ss.page += 1
@@ -389,6 +490,8 @@ class MangaFeedMenu(Menu):
     )
 
     def __init__(self, chosen_manga: Manga, cfg: Config):
+        from mdex_tool.api.pagination import ChapterPaginator
+
         self.manga = chosen_manga
         super().__init__(cfg)  # to init self.ansi
         title_display = f"Chosen manga: {self.ansi.to_underline(chosen_manga.title)}\n"
@@ -414,6 +517,8 @@ class MangaFeedMenu(Menu):
         if not chapter_indices:
             return
 
+        from mdex_tool.api.download import Downloader
+
         logger.debug("Downloading chapter indices: %r", chapter_indices)
         unpacked_chapters = tuple(c for ct in self.cp.pages for c in ct)
         chapter_indices = [  # prevent out of bounds
@@ -421,7 +526,9 @@ class MangaFeedMenu(Menu):
         ]
 
         for c in chapter_indices:
-            d = Downloader(self.manga, unpacked_chapters[c - 1], self.cfg)
+            d = Downloader(
+                self.manga, unpacked_chapters[c - 1], self.cfg, self.cp.session
+            )
             pb = ProgressBar(self.cfg.cli, f"Downloading [{c}]")
             d.download_images(pb.display)
 
@@ -430,9 +537,9 @@ class MangaFeedMenu(Menu):
 
     def get_option(self) -> str:
         """Gets a validated option from the user."""
+        self.utils.clear()
+        self.show()
         while True:
-            self.utils.clear()
-            self.show()
             user_input = input(">> ").strip().upper()
 
             logger.debug(
@@ -446,6 +553,7 @@ class MangaFeedMenu(Menu):
 
             print(self.ansi.to_err("\nInvalid input"))
             time.sleep(self.cfg.cli.time_to_read)
+            self._reprompt(user_input, "Invalid input")
 
     def handle_option(self, option: str) -> MenuAction:
         if option == PREV_PAGE.key:
@@ -5,6 +5,7 @@ under the CliUtils class.
 """
 
 import os
+import re
 import sys
 from collections.abc import Callable
 
@@ -12,6 +13,13 @@ from mdex_tool.cli.ansi.output import AnsiOutput
 from mdex_tool.cli.getch import getch  # type: ignore
 from mdex_tool.models import Chapter, Config, Manga
 
+# A selection is a number or a range of numbers, e.g. "2" or "3-8"
+_SELECTION = re.compile(r"([0-9]+)(?:-([0-9]+))?")
+_UNEXPECTED_CHAR = re.compile(r"[^0-9-]")  # in a selection, once it's stripped
+
+# Moves the cursor home, then clears the screen and scrollback (like `clear`)
+_CLEAR_SEQUENCE = "\033[H\033[2J\033[3J"
+
 
 class CliUtils:
     """Contains general CLI utilities."""
@@ -31,6 +39,21 @@ class CliUtils:
     def __init__(self, cfg: Config):
         self.cfg = cfg
         self.ansi = AnsiOutput(cfg.cli)
+        if cfg.cli.use_ansi:  # no need to spawn a shell on every redraw
+            self.clear = self._clear_ansi  # type: ignore
+
+    def _clear_ansi(self):
+        """Clears the terminal with an escape sequence; used if ANSI is enabled."""
+        sys.stdout.write(_CLEAR_SEQUENCE)
+        sys.stdout.flush()
+
+    def erase_lines(self, count: int):
+        """
+        Erases the last `count` lines of output, leaving the cursor at the
+        start of the first erased line. This requires ANSI to be enabled.
+        """
+        sys.stdout.write(f"\033[{count}F\033[J")
+        sys.stdout.flush()
 
     def get_input_key(self) -> str:
         """
@@ -38,14 +61,15 @@ class CliUtils:
 
         Note that this uses getch(), flushing user input on first character.
         """
-        print(">> ", flush=True, end="")
+        sys.stdout.write(">> ")
+        sys.stdout.flush()  # the prompt has to show before blocking on getch()
         option = getch()
 
         if isinstance(option, bytes):
             option = option.decode()
 
         option = option.upper()
-        print(option)
+        sys.stdout.write(option + "\n")  # echo, since getch() doesn't
         return option
 
     def parse_selection(  # pylint:disable=too-many-return-statements
@@ -77,54 +101,57 @@ class CliUtils:
             error_out("Selection can't be blank")
             return []
 
-        allowed = set("0123456789-")
-        if any(ch not in allowed for s in selections for ch in s):
+        if any(map(_UNEXPECTED_CHAR.search, selections)):
             error_out(
                 "Unexpected character; only numbers, dashes, commas and spaces are allowed"
             )
             return []
 
+        # Selections usually go upwards without overlapping, in which
+        # case `nums` is already sorted and unique
+        in_order = True
         for s in selections:
-            # all chars in `s` must now be digits or dashes
+            if match := _SELECTION.fullmatch(s):
+                start, stop = match.groups()
+                first, last = int(start), int(stop or start)  # a number is a range
+                if first > last:
+                    error_out(
+                        f"{s!r}: A range selection's start must be below its end."
+                    )
+                    return []
+
+                in_order = in_order and (not nums or first > nums[-1])
+                nums += range(first, last + 1)
+                continue
+
+            # only malformed selections are left; find out what's wrong
             if not s:
                 error_out("No selection found between comma (e.g. 2,,4)")
                 return []
 
-            if s.isdigit():
-                nums.append(int(s))
-                continue
-
-            # must include one or more dashes if not digit
             if s.count("-") > 1:
                 error_out(f"{s!r}: Range selections can only have one dash")
                 return []
 
-            start, _, stop = s.partition("-")
-            if not start or not stop:
-                error_out(
-                    f"{s!r}: Both sides of a dash must have numbers to be a valid range"
-                )
-                return []
-
-            if int(start) > int(stop):
-                error_out(f"{s!r}: A range selection's start must be below its end.")
-                return []
-            nums += range(int(start), int(stop) + 1)
+            error_out(
+                f"{s!r}: Both sides of a dash must have numbers to be a valid range"
+            )
+            return []
 
-        return sorted(set(nums))
+        return nums if in_order else sorted(set(nums))
 
     def print_manga_titles(self, manga: tuple[Manga, ...]):
         """Prints manga titles with a left index for use by the user."""
-        for idx, m in enumerate(manga):
-            print(f"[{idx + 1}]: {m.title}")
+        sys.stdout.write("".join(f"[{i}]: {m.title}\n" for i, m in enumerate(manga, 1)))
 
     def print_chapter_titles(self, chapters: tuple[Chapter, ...], page: int = 0):
         """Prints chapter titles with a left index for use by the user."""
-        print()
         offset = page * self.cfg.search.results_per_page
-        for idx, c in enumerate(chapters):
+        lines = ["\n"]  # written in one go, instead of one print() per title
+        for i, c in enumerate(chapters, offset + 1):
             if c.chap_num is None:
-                print(f"[{offset + idx + 1}]: {c.title}")
+                lines.append(f"[{i}]: {c.title}\n")
             else:
-                print(f"[{offset + idx + 1}]: Ch. {c.chap_num}")
-        print()
+                lines.append(f"[{i}]: Ch. {c.chap_num}\n")
+        lines.append("\n")
+        sys.stdout.write("".join(lines))
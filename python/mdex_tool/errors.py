@@ -2,9 +2,10 @@
 Contains all subclassed exceptions used
 """
 
-from typing import override
+from typing import TYPE_CHECKING, override
 
-from requests import Response
+if TYPE_CHECKING:  # only for hints; importing requests is slow
+    from requests import Response
 
 
 class ApiError(Exception):
@@ -13,9 +14,9 @@ class ApiError(Exception):
     as a non-ok result in a response body
     """
 
-    def __init__(self, message: str, response: Response | None = None):
+    def __init__(self, message: str, response: "Response | None" = None):
         super().__init__(message)
-        self.response: Response | None = response
+        self.response: "Response | None" = response
 
 
 class ConfigError(Exception):
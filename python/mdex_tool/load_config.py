@@ -34,24 +34,10 @@ from mdex_tool.models import (
 NAME_TO_LEVEL = getLevelNamesMapping()
 logger = getLogger(__name__)
 
-
-# pylint: disable=missing-function-docstring
-def is_bool(x):
-    return isinstance(x, bool)
-
-
-def is_int(x):
-    return isinstance(x, int)
-
-
-def is_str(x):
-    return isinstance(x, str)
-
-
-def is_numeric(x):
-    return isinstance(x, (float, int))
+_NUMERIC = (float, int)  # for isinstance(); config numbers can be either
 
 
+# pylint: disable=missing-function-docstring
 def get_dirname_problems(option_name: str, dirname: str) -> str | None:
     for char in dirname:
         if not (char.isalnum() or char in ("_", "-") or char == " " and dirname):
@@ -60,7 +46,7 @@ def get_dirname_problems(option_name: str, dirname: str) -> str | None:
 
 
 # pylint: enable=missing-function-docstring
-# pylint: disable=too-many-branches too-many-statements
+# pylint: disable=too-many-branches too-many-statements too-many-locals
 def require_ok_config() -> Config:
     """
     Checks constraints and types of all values in `./config.toml`
@@ -99,108 +85,128 @@ def require_ok_config() -> Config:
 
     reqs = cfg["reqs"]  # ReqsConfig
 
-    if not is_str(reqs["api_root"]):
+    api_root = reqs["api_root"]
+    if not isinstance(api_root, str):
         errors.append("reqs.api_root: must be a string")
-    if not reqs["api_root"].startswith("https://"):
+    elif not api_root.startswith("https://"):
         errors.append("api_root: invalid URL; must start with https://")
 
-    if not is_str(reqs["report_endpoint"]):
+    report_endpoint = reqs["report_endpoint"]
+    if not isinstance(report_endpoint, str):
         errors.append("reqs.report_endpoint: must be a string")
-    if not reqs["report_endpoint"].startswith("https://"):
+    elif not report_endpoint.startswith("https://"):
         errors.append("report_endpoint: invalid URL; must start with https://")
 
-    if not is_numeric(reqs["get_timeout"]):
+    get_timeout = reqs["get_timeout"]
+    if not isinstance(get_timeout, _NUMERIC):
         errors.append("reqs.get_timeout: must be int or float")
-    elif reqs["get_timeout"] <= 0:
+    elif get_timeout <= 0:
         errors.append("reqs.get_timeout: must be greater than zero")
 
-    if not is_numeric(reqs["post_timeout"]):
+    post_timeout = reqs["post_timeout"]
+    if not isinstance(post_timeout, _NUMERIC):
         errors.append("reqs.post_timeout: must be int or float")
-    elif reqs["post_timeout"] <= 0:
+    elif post_timeout <= 0:
         errors.append("reqs.post_timeout: must be greater than zero")
 
     retry = cfg["retry"]  # RetryConfig
 
-    if not is_int(retry["max_retries"]):
+    max_retries = retry["max_retries"]
+    if not isinstance(max_retries, int):
         errors.append("retry.max_retries: must be int")
-    elif retry["max_retries"] < 0:
+    elif max_retries < 0:
         errors.append("retry.max_retries: cannot be negative")
 
-    if not is_numeric(retry["backoff_factor"]):
+    backoff_factor = retry["backoff_factor"]
+    if not isinstance(backoff_factor, _NUMERIC):
         errors.append("retry.backoff_factor: must be int or float")
-    elif retry["backoff_factor"] < 0:
+    elif backoff_factor < 0:
         errors.append("retry.backoff_factor: cannot be negative")
 
-    if not is_numeric(retry["backoff_jitter"]):
+    backoff_jitter = retry["backoff_jitter"]
+    if not isinstance(backoff_jitter, _NUMERIC):
         errors.append("retry.backoff_jitter: must be int or float")
-    elif retry["backoff_jitter"] < 0:
+    elif backoff_jitter < 0:
         errors.append("retry.backoff_jitter: cannot be negative")
 
-    if not is_numeric(retry["backoff_max"]):
+    backoff_max = retry["backoff_max"]
+    if not isinstance(backoff_max, _NUMERIC):
         errors.append("retry.backoff_max: must be int or float")
-    elif retry["backoff_max"] <= 0:
+    elif backoff_max <= 0:
         errors.append("retry.backoff_max: must be greater than zero")
 
     save = cfg["save"]  # SaveConfig
 
-    if p := get_dirname_problems("save.location", save["location"]):
+    save_location = save["location"]
+    if p := get_dirname_problems("save.location", save_location):
         errors.append(p)
     if p is None:  # lazy init
-        Path(PROJECT_ROOT / save["location"]).mkdir(parents=True, exist_ok=True)
+        Path(PROJECT_ROOT / save_location).mkdir(parents=True, exist_ok=True)
 
-    if not is_int(save["max_title_length"]):
+    max_title_length = save["max_title_length"]
+    if not isinstance(max_title_length, int):
         errors.append("save.max_title_length: must be integer")
-    elif save["max_title_length"] > 255:
+    elif max_title_length > 255:
         errors.append("save.max_title_length: must not be greater than 255")
-    elif save["max_title_length"] <= 0:
+    elif max_title_length <= 0:
         errors.append("save.max_title_length: must be greater than zero")
 
     images = cfg["images"]  # ImagesConfig
 
-    if not is_bool(images["use_datasaver"]):
+    if not isinstance(images["use_datasaver"], bool):
         errors.append("images.use_datasaver: must be true or false")
 
+    max_concurrency = images["max_concurrency"]
+    if not isinstance(max_concurrency, int):
+        errors.append("images.max_concurrency: must be integer")
+    elif max_concurrency <= 0:
+        errors.append("images.max_concurrency: must be greater than zero")
+
     search = cfg["search"]  # SearchConfig
 
-    if not is_int(search["results_per_page"]):
+    results_per_page = search["results_per_page"]
+    if not isinstance(results_per_page, int):
         errors.append("search.results_per_page: must be integer")
-    elif search["results_per_page"] <= 0:
+    elif results_per_page <= 0:
         errors.append("search.results_per_page: must be greater than zero")
 
-    if not is_bool(search["include_pornographic"]):
+    if not isinstance(search["include_pornographic"], bool):
         errors.append("search.include_pornographic: must be true or false")
 
     cli = cfg["cli"]  # CliConfig
 
-    if not is_int(cli["options_per_row"]):
+    options_per_row = cli["options_per_row"]
+    if not isinstance(options_per_row, int):
         errors.append("cli.options_per_row: must be integer")
-    if cli["options_per_row"] <= 0:
+    elif options_per_row <= 0:
         errors.append("cli.options_per_row: must be greater than zero")
 
-    if not is_bool(cli["use_ansi"]):
+    if not isinstance(cli["use_ansi"], bool):
         errors.append("cli.use_ansi: must be true or false")
 
-    if not is_numeric(cli["time_to_read"]):
+    time_to_read = cli["time_to_read"]
+    if not isinstance(time_to_read, _NUMERIC):
         errors.append("cli.time_to_read: must be int or float")
-    elif cli["time_to_read"] < 0:
+    elif time_to_read < 0:
         errors.append("cli.time_to_read: cannot be negative")
 
     logging = cfg["logging"]  # LoggingConfig
 
-    if not is_bool(logging["enabled"]):
+    if not isinstance(logging["enabled"], bool):
         errors.append("logging.enabled: must be true or false")
 
-    if not is_str(logging["level"]):
+    level = logging["level"]
+    if not isinstance(level, str):
         errors.append("logging.level: must be string")
 
-    elif logging["level"] not in ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"):
+    elif level not in ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"):
         errors.append(
             "logging.level: invalid option, must be: "
             "'CRITICAL', 'ERROR', 'WARNING', 'INFO', 'DEBUG'"
         )
     else:  # Convert to enum value
-        logging_enum = NAME_TO_LEVEL.get(logging["level"])
-        print(f"Converting logging level {logging['level']} to {logging_enum}")
+        logging_enum = NAME_TO_LEVEL.get(level)
+        print(f"Converting logging level {level} to {logging_enum}")
         logging["level"] = logging_enum
 
     if p := get_dirname_problems("logging.location", logging["location"]):
@@ -18,12 +18,15 @@ def main():
     """The GUI loop."""
     top = stack.peek()
 
-    while top is not None:
-        top.show()
-        option = top.get_option()
-        action = top.handle_option(option)
-        stack.handle_action(action)
-        top = stack.peek()
+    try:
+        while top is not None:
+            top.show()
+            option = top.get_option()
+            action = top.handle_option(option)
+            stack.handle_action(action)
+            top = stack.peek()
+    finally:  # also on quitting (SystemExit), so no prefetches hold up exit
+        stack.close_all()
 
 
 if __name__ == "__main__":
@@ -5,38 +5,42 @@ These classes are only meant as containers; they shouldn't
 have logic.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Manga:
     """
     Args:
         title (str, required): the manga title as given by the API
         uuid (str, required): UUID used for GET requests
+        tags (tuple[str, ...]): English tag names, empty unless provided
     """
 
     title: str
     uuid: str
-    # TODO: add tags
+    tags: tuple[str, ...] = ()  # immutable, so the default is safely shared
 
 
-@dataclass
+@dataclass(slots=True)
 class Chapter:
     """
     Args:
         uuid (str): UUID used for GET requests
         chap_num (str | None): used to name dirs upon download
+        pages (int | None): the page count given by the feed, if known
     """
 
     uuid: str
     chap_num: str | None = None
+    pages: int | None = None
+    title: str = field(init=False, repr=False)  # set in __post_init__
 
     def __post_init__(self):
         self.title = f"Ch. {self.chap_num or 'Unknown'}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageReport:
     """
     Contains telemetry structure gathered during download which
@@ -68,11 +72,11 @@ class ChapterGetResponse:
 
     base_url: str
     chapter_hash: str
-    filenames_data: tuple[str, ...]
-    filenames_data_saver: tuple[str, ...]
+    filenames_data: list[str]
+    filenames_data_saver: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class MangaResults:
     """Contains info gathered when `GET /manga` is invoked."""
 
@@ -113,6 +117,7 @@ class ImagesConfig:
     """Stores settings for [images] in config.toml"""
 
     use_datasaver: bool
+    max_concurrency: int
 
 
 @dataclass
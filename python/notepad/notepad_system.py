@@ -1,12 +1,82 @@
 """Contains the `Note` class and other note-related classes."""
 
 import json
+import os
 import sys
 import time
+from collections.abc import Iterator, KeysView
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from textwrap import dedent
-from typing import override
+from typing import Annotated, Any, BinaryIO, override
+
+import orjson
+
+try:  # Optional; streams notes one at a time instead of loading the whole file
+    import ijson  # pyright: ignore[reportMissingImports]
+except ImportError:
+    ijson = None
+
+try:  # Optional; parses and validates the whole file in one native pass
+    import msgspec  # pyright: ignore[reportMissingImports]
+except ImportError:
+    msgspec = None
+
+_REQ_NOTE_KEYS = frozenset(("title", "body", "created_at", "last_edited"))
+
+# Raised by each JSON backend for malformed JSON; converted to `FormatError`
+_JSON_ERRORS: tuple[type[Exception], ...] = (  # pylint: disable=invalid-name
+    json.JSONDecodeError,
+    UnicodeDecodeError,
+)
+if ijson is not None:
+    _JSON_ERRORS += (ijson.JSONError,)
+
+if msgspec is not None:
+    _NonBlankStr = Annotated[str, msgspec.Meta(min_length=1)]
+
+    # pylint: disable=too-few-public-methods
+    class _NoteSchema(msgspec.Struct, forbid_unknown_fields=True):
+        """Typed mirror of `Note.to_dict()`, checked like `_validate_note_dict`"""
+
+        title: _NonBlankStr
+        body: _NonBlankStr
+        created_at: _NonBlankStr
+        last_edited: _NonBlankStr
+
+    # Other top level keys are ignored, like in `_iter_note_dicts()`
+    class _NoteCollectionSchema(msgspec.Struct):
+        """Typed mirror of the top level of the notes JSON file"""
+
+        NoteCollection: list[_NoteSchema]  # pylint: disable=invalid-name
+
+    # pylint: enable=too-few-public-methods
+    _notes_decoder = msgspec.json.Decoder(_NoteCollectionSchema)
+
+
+def _reject_repeated_collection(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    """
+    `json` `object_pairs_hook` that raises `FormatError` if an object repeats
+    the `NoteCollection` key, instead of silently keeping the last one.
+    """
+    obj = dict(pairs)
+    if len(obj) != len(pairs) and sum(k == "NoteCollection" for k, _ in pairs) > 1:
+        raise FormatError("Duplicate top level NoteCollection key")
+    return obj
+
+
+def _reject_repeated_collection_events(
+    events: Iterator[tuple[str, str, Any]],
+) -> Iterator[tuple[str, str, Any]]:
+    """
+    Passes `ijson` events through, raising `FormatError` if the top level
+    `NoteCollection` key appears again (ijson would read both lists).
+    """
+    for prefix, event, value in events:
+        if not prefix and event == "map_key" and value == "NoteCollection":
+            raise FormatError("Duplicate top level NoteCollection key")
+        yield prefix, event, value
 
 
 # Note related exceptions
@@ -60,6 +130,22 @@ class FormatError(NoteException):
     """
 
 
+@lru_cache(maxsize=1)
+def _iso_now(ms: int) -> str:
+    """
+    Formats `ms` (from `time.time_ns() // 1_000_000`) as an ISO timestamp.
+
+    Cached so bulk creations/edits within the same millisecond
+    share one string instead of formatting a new datetime each.
+
+    Always includes milliseconds, even when they're zero, so every
+    timestamp has the same format.
+    """
+    return datetime.fromtimestamp(ms / 1000).isoformat(  # noqa: DTZ006
+        timespec="milliseconds"
+    )
+
+
 class Note:
     """
     Contains the fields:
@@ -70,6 +156,8 @@ class Note:
     - `last_edited` (str)
     """
 
+    __slots__ = ("title", "body", "_created_at", "last_edited")
+
     def __init__(self, title: str, body: str, created_at: str, last_edited: str):
         if not title.strip():
             raise BlankTitleError()
@@ -112,7 +200,7 @@ class Note:
         This auto-fills the `created_at` and `last_edited` fields.
         """
 
-        created_at = last_edited = datetime.now().isoformat()  # noqa: DTZ005
+        created_at = last_edited = _iso_now(time.time_ns() // 1_000_000)
         return Note(title, body, created_at, last_edited)
 
 
@@ -120,29 +208,41 @@ class NoteCollection:
     """A list of `Note` objects, uniquely identified by their titles"""
 
     def __init__(self, notes: list[Note]):
+        """Raises `TitleAlreadyExistsError` if two of the `notes` share a title."""
         self.notes: list[Note] = notes
+        # Kept in sync with `notes` by add/edit/delete for O(1) lookups.
+        # Titles are unique, so each note has exactly one entry
+        self._title_to_idx: dict[str, int] = {}
+        for i, n in enumerate(notes):
+            if self._title_to_idx.setdefault(n.title, i) != i:
+                raise TitleAlreadyExistsError(n.title)
 
     @override
     def __repr__(self) -> str:
         notes_repr = [repr(note) for note in self.notes]
         return f"NoteCollection({notes_repr})"
 
+    def to_json_bytes(self) -> bytes:
+        """Converts `self` to UTF-8 encoded JSON."""
+        # Each note is converted by `default` as it's reached; no list of dicts
+        return orjson.dumps(
+            {"NoteCollection": self.notes},
+            default=Note.to_dict,
+            option=orjson.OPT_INDENT_2,
+        )
+
     def to_json(self) -> str:
         """Converts `self` to a JSON-formatted string."""
-        notes_dict = [note.to_dict() for note in self.notes]
-        return json.dumps({"NoteCollection": notes_dict}, indent=4)
+        return self.to_json_bytes().decode()
 
     @property
-    def all_titles(self) -> tuple[str, ...]:
-        """Returns all notes' titles as a tuple."""
-        return tuple(note.title for note in self.notes)
+    def all_titles(self) -> KeysView[str]:
+        """Returns all notes' titles as a (live) view."""
+        return self._title_to_idx.keys()
 
     def find_note_index(self, title: str) -> int:
         """Finds a note with the specified `title`, returns -1 if not found."""
-        try:
-            return self.all_titles.index(title)
-        except ValueError:
-            return -1  # Use this for raising errors
+        return self._title_to_idx.get(title, -1)  # Use -1 for raising errors
 
     # Consider using kwargs when calling this
     def edit_note(self, curr_title: str, new_title: str, new_body: str):
@@ -154,9 +254,11 @@ class NoteCollection:
         - else, raise `NotFoundError`
         """
 
-        idx = self.find_note_index(curr_title)
+        titles = self._title_to_idx  # Single index lookup for both checks
+        idx = titles.get(curr_title, -1)
+        renamed = curr_title != new_title
 
-        if curr_title != new_title and new_title in self.all_titles:
+        if renamed and new_title in titles:
             raise TitleAlreadyExistsError(new_title)
         if idx == -1:
             raise NotFoundError(curr_title)
@@ -166,9 +268,13 @@ class NoteCollection:
             raise BlankBodyError()
 
         note = self.notes[idx]
+        if renamed:
+            del titles[curr_title]
+            titles[new_title] = idx
+
         note.title = new_title
         note.body = new_body
-        note.last_edited = datetime.now().isoformat()  # noqa: DTZ005
+        note.last_edited = _iso_now(time.time_ns() // 1_000_000)
 
     def add_note(self, note: Note):
         """
@@ -176,7 +282,8 @@ class NoteCollection:
         taken, otherwise, raises `TitleAlreadyExistsError`.
         """
 
-        if note.title not in self.all_titles:
+        if note.title not in self._title_to_idx:
+            self._title_to_idx[note.title] = len(self.notes)
             self.notes.append(note)
         else:
             raise TitleAlreadyExistsError(note.title)
@@ -189,10 +296,76 @@ class NoteCollection:
         """
 
         note_idx = self.find_note_index(title)
-        if note_idx != -1:
-            return self.notes.pop(note_idx)
+        if note_idx == -1:
+            raise NotFoundError(title)
+
+        del self._title_to_idx[title]
+        removed = self.notes.pop(note_idx)
+
+        # Shift indices of the notes after the removed one (titles are
+        # unique, so each of them owns its entry)
+        for i in range(note_idx, len(self.notes)):
+            self._title_to_idx[self.notes[i].title] = i
+
+        return removed
+
+    @staticmethod
+    def _iter_note_dicts(f: BinaryIO) -> Iterator[dict[str, Any]]:
+        """
+        Lazily yields each note (as a `dict`) under the top level
+        `NoteCollection` key of the (non-empty) JSON file `f`.
+
+        Uses `ijson` to stream the file if installed, else `json`.
 
-        raise NotFoundError(title)
+        Raises `FormatError` if `NoteCollection` is missing or isn't a list,
+        or if the file isn't valid JSON.
+        """
+
+        try:
+            yield from NoteCollection._iter_note_dicts_unchecked(f)
+        except _JSON_ERRORS as e:
+            raise FormatError(f"Invalid notes file ({e})") from None
+
+    @staticmethod
+    def _iter_note_dicts_unchecked(f: BinaryIO) -> Iterator[dict[str, Any]]:
+        """`_iter_note_dicts()`, without converting JSON decoding errors."""
+
+        if ijson is None:
+            data = json.load(  # pyright: ignore[reportAny]
+                f, object_pairs_hook=_reject_repeated_collection
+            )
+            if not isinstance(data, dict):
+                raise FormatError("Expected a JSON object at the top level")
+            if "NoteCollection" not in data:
+                raise FormatError(
+                    "Missing top level NoteCollection key (file is not empty)"
+                )
+            collection = data["NoteCollection"]  # pyright: ignore[reportAny]
+            if not isinstance(collection, list):
+                t = type(  # pyright: ignore[reportUnknownVariableType]
+                    collection  # pyright: ignore[reportAny]
+                )
+                raise FormatError(f"Expected list for NoteCollection, instead got {t}")
+
+            yield from collection  # pyright: ignore[reportUnknownArgumentType]
+            return
+
+        events = ijson.parse(f)  # pyright: ignore[reportUnknownMemberType]
+        for prefix, event, _ in events:  # pyright: ignore[reportUnknownVariableType]
+            if prefix == "NoteCollection":  # Opening event of the key's value
+                if event != "start_array":
+                    raise FormatError(
+                        f"Expected list for NoteCollection, instead got {event}"
+                    )
+                break
+        else:
+            raise FormatError(
+                "Missing top level NoteCollection key (file is not empty)"
+            )
+
+        yield from ijson.items(  # pyright: ignore[reportUnknownMemberType]
+            _reject_repeated_collection_events(events), "NoteCollection.item"
+        )
 
     @staticmethod
     def validate_json(fp: Path, strict: bool = True) -> None:
@@ -213,55 +386,84 @@ class NoteCollection:
             return  # Do not error on empty data
 
         # Only ran iff strict=True
-        with fp.open() as f:
-            data = json.load(f)  # pyright: ignore[reportAny]
-            req_note_keys = ("title", "body", "created_at", "last_edited")
-            collection = data.get("NoteCollection")  # pyright: ignore[reportAny]
-
-            if collection is None:
-                raise FormatError(
-                    "Missing top level NoteCollection key (file is not empty)"
-                )
-
-            if not isinstance(collection, list):
-                t = type(  # pyright: ignore[reportUnknownVariableType]
-                    collection  # pyright: ignore[reportAny]
-                )
-                raise FormatError(f"Expected list for NoteCollection, instead got {t}")
-
-            # fmt: off
-            for note in collection:  # pyright: ignore[reportUnknownVariableType]
-                if not all(
-                    note.get(key) for key in req_note_keys  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType] pylint: disable[line-too-long]
-                ):
-                    raise FormatError("Missing or blank Note keys")
-            # fmt: on
+        with fp.open("rb") as f:
+            for note in NoteCollection._iter_note_dicts(f):
+                NoteCollection._validate_note_dict(note)
         return
 
+    @staticmethod
+    def _validate_note_dict(note: dict[str, Any]) -> None:
+        """
+        Raises `FormatError` if the `note` has missing, unknown or blank keys.
+        """
+        if not isinstance(note, dict):
+            raise FormatError("Expected each Note to be a JSON object")
+        if not _REQ_NOTE_KEYS <= note.keys():  # Subset check
+            raise FormatError("Missing or blank Note keys")
+        if note.keys() != _REQ_NOTE_KEYS:  # Matches msgspec's forbidden fields
+            raise FormatError("Unknown Note keys")
+        if not all(isinstance(note[key], str) and note[key] for key in _REQ_NOTE_KEYS):
+            raise FormatError("Missing or blank Note keys")
+
     @staticmethod
     def write_to_json(collection: "NoteCollection", fp: Path):
         """Writes `self` as JSON to the given path `fp`."""
 
         # Non-strict - Only checks fp exists and is json
         NoteCollection.validate_json(fp, strict=False)
-        with fp.open("w") as f:
-            f.write(collection.to_json())
+
+        # Write everything at once to a temp file, then swap it in so
+        # a crash mid-write can't leave `fp` truncated
+        tmp = fp.with_suffix(".json.tmp")
+        tmp.write_bytes(collection.to_json_bytes())
+        os.replace(tmp, fp)
 
     @staticmethod
     def from_json(fp: Path) -> "NoteCollection":
         """Creates a `NoteCollection` instance from the given JSON from path `fp`."""
 
-        NoteCollection.validate_json(fp)
+        # Notes are validated below as they're read, so the file is only parsed once
+        NoteCollection.validate_json(fp, strict=False)
 
-        with fp.open() as f:
+        if msgspec is not None:
+            data = fp.read_bytes()
+            if not data:  # Empty
+                return NoteCollection([])
+            try:
+                root = _notes_decoder.decode(data)
+            except msgspec.DecodeError as e:  # also covers ValidationError
+                raise FormatError(f"Invalid notes file ({e})") from None
+            # msgspec keeps the last of a repeated key; rarely, the key's
+            # text appears more than once, so check it properly with `json`
+            if data.count(b'"NoteCollection"') > 1:
+                json.loads(data, object_pairs_hook=_reject_repeated_collection)
+            return NoteCollection._from_loaded_notes(
+                [
+                    Note(n.title, n.body, n.created_at, n.last_edited)
+                    for n in root.NoteCollection
+                ]
+            )
+
+        notes: list[Note] = []
+
+        with fp.open("rb") as f:
             if not f.readline():  # Empty
                 return NoteCollection([])
 
             f.seek(0)
-            notes_dict = json.load(f)["NoteCollection"]  # pyright: ignore[reportAny]
+            for note in NoteCollection._iter_note_dicts(f):
+                NoteCollection._validate_note_dict(note)
+                notes.append(Note(**note))
+
+        return NoteCollection._from_loaded_notes(notes)
 
-        notes = [Note(**note) for note in notes_dict]  # pyright: ignore[reportAny]
-        return NoteCollection(notes)
+    @staticmethod
+    def _from_loaded_notes(notes: list[Note]) -> "NoteCollection":
+        """Creates a `NoteCollection` from notes read from a file."""
+        try:
+            return NoteCollection(notes)
+        except TitleAlreadyExistsError as e:
+            raise FormatError(f"Duplicate note title '{e.title}'") from None
 
 
 if __name__ == "__main__":  # Create test notes